@@ -7,23 +7,63 @@ and the HTML/CSS/JavaScript required for the interactive frontend.
 
 To run this:
 1. Ensure you have Python installed.
-2. Install Flask: pip install Flask
+2. Install Flask and NumPy: pip install Flask numpy
+   (Optional) Install Numba to JIT-compile the /sweep endpoint: pip install numba
+   (Optional) Install Brotli to serve the landing page brotli-compressed: pip install brotli
 3. Save this code as 'app.py'.
 4. Run: python app.py
 5. Open your web browser to http://127.0.0.1:5000/
+
+For production, install Gunicorn (pip install gunicorn) and run: PROD=1 python app.py
 """
-from flask import Flask, request, render_template_string
+from flask import Flask, Response, request, jsonify
+from datetime import datetime, timezone
+import collections
+import functools
+import gzip
+import hashlib
 import math
+import os
+import sys
+import threading
+import types
+from typing import NamedTuple
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional: fall back to running the batch kernel as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    import brotli
+except ImportError:
+    # Brotli is optional: without it the landing page is offered gzip-compressed only
+    brotli = None
+
+# Bound once so the hot path skips the attribute lookup on the math module
+_pow = math.pow
 
 # --- 1. COCOMO CONSTANTS AND CORE LOGIC ---
 
-# [a, b, c, d] for E = a * (KLOC)^b and D = c * (E)^d
+# (a, b, c, d) for E = a * (KLOC)^b and D = c * (E)^d
 COCOMO_PARAMS = {
-    'organic': [2.4, 1.05, 2.5, 0.38],
-    'semidetached': [3.0, 1.12, 2.5, 0.35],
-    'embedded': [3.6, 1.20, 2.5, 0.32],
+    'organic': (2.4, 1.05, 2.5, 0.38),
+    'semidetached': (3.0, 1.12, 2.5, 0.35),
+    'embedded': (3.6, 1.20, 2.5, 0.32),
 }
 
+# Error shown for a project mode that is not in COCOMO_PARAMS
+_INVALID_MODE_ERROR = "Invalid project mode selected."
+
+# Same parameters as a (modes x 4) float64 array for the batch kernel, indexed via MODE_INDEX
+MODE_INDEX = {mode: i for i, mode in enumerate(COCOMO_PARAMS)}
+_COCOMO_PARAMS_ARR = np.array(list(COCOMO_PARAMS.values()), dtype=np.float64)
+
 # Effort Multipliers (Cost Drivers) Data
 COST_DRIVERS_DATA = {
     'RELY': {'name': 'Required Software Reliability', 'levels': {'VL': 0.75, 'L': 0.88, 'N': 1.00, 'H': 1.15, 'VH': 1.40}, 'default': 1.00},
@@ -33,84 +73,307 @@ COST_DRIVERS_DATA = {
     'VIRT': {'name': 'Virtual Machine Volatility', 'levels': {'L': 0.87, 'N': 1.00, 'H': 1.15, 'VH': 1.30}, 'default': 1.00},
 }
 
-def calculate_cocomo(kloc, mode, drivers, salary):
-    """Performs the full COCOMO Intermediate Model calculation in Python (Backend)."""
-    
-    # --- 1. Calculate Effort Adjustment Factor (EAF) ---
-    eaf = 1.0
-    for value in drivers.values():
-        eaf *= float(value)
-        
-    # Get COCOMO parameters
-    try:
-        a, b_exp, c, d_exp = COCOMO_PARAMS[mode]
-    except KeyError:
-        return None, "Invalid project mode selected."
+def _validate_cost_drivers():
+    """Checks the structure of COST_DRIVERS_DATA once at import, so requests can rely on it."""
+    for key, driver in COST_DRIVERS_DATA.items():
+        levels = driver.get('levels')
+        if not isinstance(driver.get('name'), str) or not levels:
+            raise ValueError(f"Cost driver {key} needs a name and at least one level.")
+        if not all(isinstance(value, float) and value > 0 for value in levels.values()):
+            raise ValueError(f"Cost driver {key} levels must be positive floats.")
+        if driver.get('default') not in levels.values():
+            raise ValueError(f"Cost driver {key} default must be one of its levels.")
+
+_validate_cost_drivers()
+
+# Driver keys and their defaults as parallel tuples, for the per-request EAF computation
+_DRIVER_KEYS = tuple(COST_DRIVERS_DATA)
+_DRIVER_DEFAULTS = tuple(driver['default'] for driver in COST_DRIVERS_DATA.values())
+# Accepted multiplier values per driver, in the same order as _DRIVER_KEYS
+_DRIVER_LEVELS = tuple(frozenset(driver['levels'].values()) for driver in COST_DRIVERS_DATA.values())
+
+# Render-ready view of COST_DRIVERS_DATA, built once at import so the template does not
+# stringify every option value on each request. Levels are (level, value_str) tuples.
+COST_DRIVERS_RENDER = {
+    key: {
+        'name': driver['name'],
+        'levels': [(level, str(value)) for level, value in driver['levels'].items()],
+        'default_str': str(driver['default']),
+    }
+    for key, driver in COST_DRIVERS_DATA.items()
+}
 
-    # --- 2. Calculate Estimated Effort (E) in Person-Months (PM) ---
+# EAF for every combination of cost driver levels, one axis per driver (shape (5, 4, 6, 5, 4)).
+# Built once at import so optimistic/pessimistic bounds need no per-request work.
+_EAF_GRID = functools.reduce(np.multiply, np.ix_(*(np.array(list(driver['levels'].values()), dtype=np.float64)
+                                                   for driver in COST_DRIVERS_DATA.values())))
+_EAF_MIN = float(_EAF_GRID.min())
+_EAF_MAX = float(_EAF_GRID.max())
+
+# Source for the per-mode COCOMO formula. The mode's parameters are baked in as literals,
+# so each call skips the COCOMO_PARAMS lookup and tuple unpack.
+_CALC_SOURCE = """
+def _calc_{mode}(kloc, eaf, salary):
     # E = a * (KLOC)^b * EAF
-    effort_pm = a * (float(kloc) ** b_exp) * eaf
-
-    # --- 3. Development Time (D) in Months ---
+    effort_pm = {a!r} * _pow(kloc, {b!r}) * eaf
     # D = c * (E)^d
-    duration_months = c * (effort_pm ** d_exp)
-
-    # --- 4. Average Staffing (P) in People ---
-    # P = E / D
-    avg_people = effort_pm / duration_months
-    
-    # --- 5. Total Cost (C) ---
-    # C = Effort * Salary
-    total_cost = effort_pm * float(salary)
-
-    return {
-        'effort_pm': round(effort_pm, 2),
-        'duration_months': round(duration_months, 2),
-        'avg_people': round(avg_people, 2),
-        'total_cost': round(total_cost, 0),
-        'eaf': round(eaf, 3),
-        'kloc': float(kloc),
-        'mode': mode.capitalize()
-    }, None
+    duration_months = {c!r} * _pow(effort_pm, {d!r})
+    # P = E / D, C = Effort * Salary
+    return effort_pm, duration_months, effort_pm / duration_months, effort_pm * salary
+"""
+
+def _build_calc(mode, a, b, c, d):
+    """Compiles the COCOMO formula for one mode with its parameters as constants."""
+    namespace = {'_pow': _pow}
+    exec(_CALC_SOURCE.format(mode=mode, a=a, b=b, c=c, d=d), namespace)
+    return namespace[f'_calc_{mode}']
+
+# mode -> specialised function returning (effort_pm, duration_months, avg_people, total_cost)
+_CALC = {mode: _build_calc(mode, *params) for mode, params in COCOMO_PARAMS.items()}
+
+class Result(NamedTuple):
+    """COCOMO estimate passed to the template; display fields are preformatted strings."""
+    effort_pm: str
+    duration_months: str
+    avg_people: str
+    total_cost: str
+    eaf: float
+    kloc: str
+    mode: str
+    # Unformatted copies for the chart width math
+    effort_pm_f: float
+    duration_months_f: float
+
+# The input space (KLOC, mode, EAF, salary) is small and heavily repeated, so identical
+# calculations are served from the cache.
+@functools.lru_cache(maxsize=4096)
+def calculate_cocomo(kloc, mode, eaf, salary):
+    """Performs the full COCOMO Intermediate Model calculation in Python (Backend).
+
+    KLOC, salary and the Effort Adjustment Factor (EAF, the product of all cost driver
+    multipliers) are expected as floats; the route handler computes and converts them.
+    """
+    # Get the formula specialised for this project mode
+    calc = _CALC.get(mode)
+    if calc is None:
+        return None, _INVALID_MODE_ERROR
+
+    # --- 2-5. Effort (PM), Development Time (months), Average Staffing, Total Cost ---
+    effort_pm, duration_months, avg_people, total_cost = calc(kloc, eaf, salary)
+
+    # Display values are formatted once here; the *_f copies feed the chart width math
+    return Result(
+        effort_pm=f"{effort_pm:,.2f}",
+        duration_months=f"{duration_months:,.2f}",
+        avg_people=f"{avg_people:,.2f}",
+        total_cost=f"{total_cost:,.0f}",
+        eaf=round(eaf, 3),
+        kloc=f"{kloc:,.0f}",
+        mode=mode.capitalize(),
+        effort_pm_f=effort_pm,
+        duration_months_f=duration_months,
+    ), None
+
+# Single-threaded on purpose: Gunicorn runs several threaded workers, and Numba's default
+# parallel layer is not thread-safe. cache=True keeps the compiled kernel on disk so
+# workers do not JIT-compile on their first request.
+@njit(fastmath=True, cache=True)
+def _cocomo_batch(kloc, params_row, eaf, salary):
+    """Vectorised COCOMO over an array of KLOC values (used by the /sweep endpoint)."""
+    n = kloc.shape[0]
+    effort = np.empty(n)
+    duration = np.empty(n)
+    people = np.empty(n)
+    cost = np.empty(n)
+    for i in range(n):
+        e = params_row[0] * np.power(kloc[i], params_row[1]) * eaf
+        d = params_row[2] * np.power(e, params_row[3])
+        effort[i] = e
+        duration[i] = d
+        people[i] = e / d
+        cost[i] = e * salary
+    return effort, duration, people, cost
+
+def _compute_eaf(values):
+    """Computes the Effort Adjustment Factor from submitted cost driver values.
+
+    values is a mapping such as request.form or request.args; drivers missing from it are
+    taken at their defaults. Returns (eaf, None), or (None, error message) if invalid.
+    """
+    try:
+        drivers = [float(values.get(key, default))
+                   for key, default in zip(_DRIVER_KEYS, _DRIVER_DEFAULTS)]
+    except (ValueError, TypeError):
+        return None, "Please ensure all numerical fields are filled correctly."
+
+    # Only the listed levels are accepted, which also rules out zero, negative and NaN multipliers
+    if not all(value in levels for value, levels in zip(drivers, _DRIVER_LEVELS)):
+        return None, "Cost driver values must be one of the listed levels."
+
+    # EAF = product of all cost driver multipliers
+    eaf = math.prod(drivers)
+    if not (math.isfinite(eaf) and eaf > 0):
+        return None, "Effort Adjustment Factor must be a positive finite number."
+    return eaf, None
 
 # --- 2. FLASK APP SETUP AND ROUTING ---
 
 app = Flask(__name__)
 
-# Main route handling both form display (GET) and calculation (POST)
-@app.route('/', methods=['GET', 'POST'])
-def index():
+def _encoded_response(bodies):
+    """Builds an HTML response from {content-encoding: bytes}, picking the client's preferred encoding."""
+    encoding = request.accept_encodings.best_match(bodies, default='identity')
+    response = Response(bodies[encoding], mimetype='text/html')
+    if encoding != 'identity':
+        response.content_encoding = encoding
+    response.vary.add('Accept-Encoding')
+    return response, encoding
+
+# Landing page (GET): the page is constant, so it is served from the bytes pre-rendered
+# (and pre-compressed) at import
+@app.get('/')
+def index_get():
+    response, encoding = _encoded_response(_CACHED_GET_BODIES)
+    response.set_etag(_CACHED_GET_ETAGS[encoding])
+    response.last_modified = _LOADED_AT
+    return response.make_conditional(request)
+
+# Rendered POST pages, most recently used last. The page depends only on the form fields
+# the template reads, so their raw values are the key. Guarded by a lock since workers
+# may serve requests from several threads.
+_POST_CACHE = collections.OrderedDict()
+_POST_CACHE_MAX = 256
+_POST_CACHE_FIELDS = ('kloc', 'salary', 'mode') + _DRIVER_KEYS
+_POST_CACHE_LOCK = threading.Lock()
+# Encodings offered for POST pages, in order of server preference
+_POST_ENCODINGS = ('gzip', 'identity')
+
+# Calculation (POST): runs the estimate and renders the page with the results.
+# Repeated identical submissions skip both the calculation and the render.
+@app.post('/')
+def index_post():
+    key = tuple(request.form.get(field) for field in _POST_CACHE_FIELDS)
+    with _POST_CACHE_LOCK:
+        bodies = _POST_CACHE.get(key)
+        if bodies is not None:
+            _POST_CACHE.move_to_end(key)
+
+    if bodies is None:
+        bodies = {'identity': _render_post().encode('utf-8')}
+        with _POST_CACHE_LOCK:
+            _POST_CACHE[key] = bodies
+            if len(_POST_CACHE) > _POST_CACHE_MAX:
+                _POST_CACHE.popitem(last=False)
+
+    # Most submissions are seen once, so the gzip copy is only made when a client asks for
+    # it, at a moderate level. Cached dicts are replaced rather than mutated, since other
+    # threads may be reading them.
+    encoding = request.accept_encodings.best_match(_POST_ENCODINGS, default='identity')
+    if encoding not in bodies:
+        bodies = {**bodies, encoding: gzip.compress(bodies['identity'], compresslevel=6, mtime=0)}
+        with _POST_CACHE_LOCK:
+            if key in _POST_CACHE:
+                _POST_CACHE[key] = bodies
+
+    response, _ = _encoded_response(bodies)
+    return response
+
+def _render_post():
+    """Runs the calculation for the submitted form and renders the results page."""
     results = None
     error = None
 
-    if request.method == 'POST':
-        try:
-            # Gather inputs from the web form
-            kloc = float(request.form.get('kloc'))
-            salary = float(request.form.get('salary'))
-            mode = request.form.get('mode')
-            
-            # Gather cost driver inputs
-            drivers = {}
-            for key in COST_DRIVERS_DATA:
-                drivers[key] = request.form.get(key)
-                
-            # Perform calculation in the Python backend
-            if kloc <= 0 or salary <= 0:
-                error = "KLOC and Salary must be positive numbers."
-            else:
-                results, error = calculate_cocomo(kloc, mode, drivers, salary)
-
-        except (ValueError, TypeError):
-            error = "Please ensure all numerical fields are filled correctly."
-        except Exception as e:
-            error = f"A server error occurred: {e}"
-
-    # Render the HTML template, passing results and constants
-    return render_template_string(HTML_TEMPLATE, 
-                                  cost_drivers_data=COST_DRIVERS_DATA,
-                                  results=results,
-                                  error=error)
+    try:
+        # Gather inputs from the web form
+        kloc = float(request.form.get('kloc'))
+        salary = float(request.form.get('salary'))
+        mode = request.form.get('mode')
+
+        # Perform calculation in the Python backend
+        if kloc <= 0 or salary <= 0:
+            error = "KLOC and Salary must be positive numbers."
+        elif mode not in _CALC:
+            error = _INVALID_MODE_ERROR
+        else:
+            eaf, error = _compute_eaf(request.form)
+            if error is None:
+                results, error = calculate_cocomo(kloc, mode, eaf, salary)
+
+    except (ValueError, TypeError):
+        error = "Please ensure all numerical fields are filled correctly."
+    except Exception as e:
+        error = f"A server error occurred: {e}"
+
+    # Selected option per cost driver: the submitted value, falling back to the default
+    selected = {key: request.form.get(key, driver['default_str'])
+                for key, driver in COST_DRIVERS_RENDER.items()}
+
+    # Render the precompiled HTML template, passing results and constants.
+    # Template.render() skips Flask's context processors, so request is passed explicitly.
+    return _COMPILED_TPL.render(cost_drivers_data=COST_DRIVERS_RENDER,
+                                selected=selected,
+                                results=results,
+                                error=error,
+                                request=request)
+
+# Upper bound on KLOC points per sweep request
+SWEEP_MAX_STEPS = 10000
+
+# Batch estimation over a KLOC range, e.g. /sweep?mode=organic&kloc_min=1&kloc_max=100&steps=50
+@app.route('/sweep', methods=['GET'])
+def sweep():
+    try:
+        kloc_min = float(request.args.get('kloc_min', 1))
+        kloc_max = float(request.args.get('kloc_max', 100))
+        steps = int(request.args.get('steps', 100))
+        salary = float(request.args.get('salary', 8000))
+        mode = request.args.get('mode', 'organic')
+
+    except (ValueError, TypeError):
+        return jsonify(error="Please ensure all numerical fields are filled correctly."), 400
+
+    if mode not in MODE_INDEX:
+        return jsonify(error=_INVALID_MODE_ERROR), 400
+    if not all(map(math.isfinite, (kloc_min, kloc_max, salary))):
+        return jsonify(error="KLOC range and Salary must be finite numbers."), 400
+    if not (0 < kloc_min <= kloc_max) or not salary > 0:
+        return jsonify(error="KLOC range and Salary must be positive numbers."), 400
+    eaf, error = _compute_eaf(request.args)
+    if error:
+        return jsonify(error=error), 400
+    if not 1 <= steps <= SWEEP_MAX_STEPS:
+        return jsonify(error=f"Steps must be between 1 and {SWEEP_MAX_STEPS}."), 400
+
+    kloc = np.linspace(kloc_min, kloc_max, steps)
+    params_row = _COCOMO_PARAMS_ARR[MODE_INDEX[mode]]
+
+    # Finite inputs can still overflow (huge KLOC or salary) to inf, or underflow (tiny KLOC)
+    # to zero effort, which the kernel would turn into 0/0. Neither inf nor NaN is valid JSON,
+    # and the kernel is compiled with fastmath, so both are rejected before it runs. The
+    # warnings numpy would print for the overflow/underflow itself are silenced.
+    with np.errstate(over='ignore', under='ignore'):
+        # Most optimistic / most pessimistic effort across all cost driver combinations
+        base_effort = params_row[0] * np.power(kloc, params_row[1])
+        too_large = not np.isfinite(base_effort * _EAF_MAX * salary).all()
+        too_small = not (base_effort * _EAF_MIN > 0).all()
+    if too_large:
+        return jsonify(error="KLOC range or Salary is too large to estimate."), 400
+    if too_small:
+        return jsonify(error="KLOC range is too small to estimate."), 400
+
+    effort, duration, people, cost = _cocomo_batch(kloc, params_row, eaf, salary)
+
+    return jsonify(
+        mode=mode.capitalize(),
+        eaf=round(eaf, 3),
+        kloc=kloc.tolist(),
+        effort_pm=effort.tolist(),
+        duration_months=duration.tolist(),
+        avg_people=people.tolist(),
+        total_cost=cost.tolist(),
+        effort_pm_min=(base_effort * _EAF_MIN).tolist(),
+        effort_pm_max=(base_effort * _EAF_MAX).tolist(),
+    )
 
 # --- 3. HTML TEMPLATE (Frontend) ---
 
@@ -216,10 +479,10 @@ HTML_TEMPLATE = """
                         <div>
                             <label for="{{ key }}" class="block mb-2 text-sm font-medium text-gray-700">{{ driver.name }} ({{ key }})</label>
                             <select id="{{ key }}" name="{{ key }}" class="form-input bg-white">
-                                {% for level, value in driver.levels.items() %}
-                                <option value="{{ value }}" 
-                                    {% if request.form[key] == value|string or (not request.form and value == driver.default) %}selected{% endif %}>
-                                    {{ level }} ({{ value }})
+                                {% for level, value_str in driver.levels %}
+                                <option value="{{ value_str }}" 
+                                    {% if value_str == selected[key] %}selected{% endif %}>
+                                    {{ level }} ({{ value_str }})
                                 </option>
                                 {% endfor %}
                             </select>
@@ -253,19 +516,19 @@ HTML_TEMPLATE = """
                     <!-- Effort -->
                     <div class="result-card p-4 bg-primary-color/5 rounded-lg shadow-md" style="--primary-color: #059669;">
                         <p class="text-sm text-primary-color font-medium">Estimated Effort</p>
-                        <p class="text-3xl font-bold text-gray-900">{{ "{:,.2f}".format(results.effort_pm) }} PM</p>
+                        <p class="text-3xl font-bold text-gray-900">{{ results.effort_pm }} PM</p>
                         <p class="text-sm text-gray-500 italic">Person-Months</p>
                     </div>
                     <!-- Duration -->
                     <div class="result-card p-4 bg-blue-50 rounded-lg shadow-md" style="--primary-color: #3b82f6;">
                         <p class="text-sm text-blue-600 font-medium">Development Time</p>
-                        <p class="text-3xl font-bold text-gray-900">{{ "{:,.2f}".format(results.duration_months) }} Months</p>
+                        <p class="text-3xl font-bold text-gray-900">{{ results.duration_months }} Months</p>
                         <p class="text-sm text-gray-500 italic">Time to completion</p>
                     </div>
                     <!-- Cost -->
                     <div class="result-card p-4 bg-yellow-50 rounded-lg shadow-md" style="--primary-color: #f59e0b;">
                         <p class="text-sm text-secondary-color font-medium">Total Cost</p>
-                        <p class="text-3xl font-bold text-gray-900">${{ "{:,.0f}".format(results.total_cost) }}</p>
+                        <p class="text-3xl font-bold text-gray-900">${{ results.total_cost }}</p>
                         <p class="text-sm text-gray-500 italic">Estimated Budget</p>
                     </div>
                 </div>
@@ -273,9 +536,9 @@ HTML_TEMPLATE = """
                 <!-- Summary -->
                 <p class="text-lg font-semibold text-gray-700 mt-6 pt-4 border-t">Summary</p>
                 <p class="text-sm text-gray-600">
-                    Your **{{ results.mode }}** project ({{ "{:,.0f}".format(results.kloc) }} KLOC) requires an average staffing of 
-                    <span class="font-bold text-primary-color">{{ "{:,.2f}".format(results.avg_people) }} people</span> 
-                    to complete the work in <span class="font-bold text-primary-color">{{ "{:,.2f}".format(results.duration_months) }} months.</span>
+                    Your **{{ results.mode }}** project ({{ results.kloc }} KLOC) requires an average staffing of 
+                    <span class="font-bold text-primary-color">{{ results.avg_people }} people</span> 
+                    to complete the work in <span class="font-bold text-primary-color">{{ results.duration_months }} months.</span>
                 </p>
                 <p class="text-xs text-gray-500 mt-2">
                     Effort Adjustment Factor (EAF): <span class="font-semibold">{{ results.eaf }}</span>
@@ -285,16 +548,16 @@ HTML_TEMPLATE = """
                 <div class="mt-6 pt-4 border-t">
                     <h3 class="text-base font-semibold text-gray-700 mb-2">Effort vs. Time Ratio</h3>
                     <div class="w-full bg-gray-200 rounded-lg overflow-hidden">
-                        {% set total = results.effort_pm + results.duration_months %}
-                        {% set effort_width = (results.effort_pm / total) * 100 %}
-                        {% set duration_width = (results.duration_months / total) * 100 %}
+                        {% set total = results.effort_pm_f + results.duration_months_f %}
+                        {% set effort_width = (results.effort_pm_f / total) * 100 %}
+                        {% set duration_width = (results.duration_months_f / total) * 100 %}
                         
                         <div class="flex h-6 text-xs font-medium">
                             <div style="width:{{ effort_width }}%;" class="bg-primary-color text-white text-center p-1">
-                                {{ "{:,.0f}".format(results.effort_pm) }} PM
+                                {{ "{:,.0f}".format(results.effort_pm_f) }} PM
                             </div>
                             <div style="width:{{ duration_width }}%;" class="bg-blue-500 text-white text-center p-1">
-                                {{ "{:,.0f}".format(results.duration_months) }} M
+                                {{ "{:,.0f}".format(results.duration_months_f) }} M
                             </div>
                         </div>
                     </div>
@@ -309,9 +572,48 @@ HTML_TEMPLATE = """
 </html>
 """
 
+# Compiled once at import; equivalent to render_template_string(HTML_TEMPLATE, ...) but
+# without the per-request template cache lookup.
+_COMPILED_TPL = app.jinja_env.from_string(HTML_TEMPLATE)
+
+# GET responses carry no form data, so the landing page is rendered once here.
+# An empty form makes the template fall back to its defaults, exactly as a real GET would.
+_CACHED_GET_HTML = _COMPILED_TPL.render(
+    cost_drivers_data=COST_DRIVERS_RENDER,
+    selected={key: driver['default_str'] for key, driver in COST_DRIVERS_RENDER.items()},
+    results=None,
+    error=None,
+    request=types.SimpleNamespace(form={}),
+).encode('utf-8')
+
+# Compressed variants keyed by Content-Encoding, in order of server preference
+_CACHED_GET_BODIES = {}
+if brotli is not None:
+    _CACHED_GET_BODIES['br'] = brotli.compress(_CACHED_GET_HTML, quality=11)
+_CACHED_GET_BODIES['gzip'] = gzip.compress(_CACHED_GET_HTML, compresslevel=9, mtime=0)
+_CACHED_GET_BODIES['identity'] = _CACHED_GET_HTML
+
+# Each encoding is a distinct representation, so each gets its own ETag
+_CACHED_GET_ETAGS = {encoding: hashlib.sha256(body).hexdigest()[:32]
+                     for encoding, body in _CACHED_GET_BODIES.items()}
+_LOADED_AT = datetime.now(timezone.utc).replace(microsecond=0)
+
 # --- 4. RUN SERVER ---
 
 if __name__ == '__main__':
+    if os.environ.get('PROD') == '1':
+        # Hand over to Gunicorn with (2 x cores + 1) threaded workers. --preload imports this
+        # module once in the master before forking, so the compiled template, EAF grid and
+        # pre-rendered landing page are shared copy-on-write instead of rebuilt per worker.
+        workers = 2 * (os.cpu_count() or 1) + 1
+        # --chdir makes 'app:app' importable wherever this script is launched from
+        app_dir = os.path.dirname(os.path.abspath(__file__))
+        try:
+            os.execvp('gunicorn', ['gunicorn', '--chdir', app_dir, '-w', str(workers), '--preload',
+                                   '-k', 'gthread', '--threads', '4', 'app:app'])
+        except FileNotFoundError:
+            sys.exit("PROD=1 requires Gunicorn. Install it with: pip install gunicorn")
+
     # Setting debug=True allows for automatic code reloading during development.
     # It should be set to False in a production environment.
     app.run(debug=True)